@@ -1 +1,24 @@
 # This file makes the deamat directory a package.
+#
+# Top-level names are resolved lazily (PEP 562) so that `import deamat`
+# stays cheap: pyglet, imgui and matplotlib are only imported once a
+# class is actually requested.
+
+_EXPORTS = {
+    'GUI': 'deamat.gui',
+    'GUIState': 'deamat.guistate',
+    'FigureRecord': 'deamat.guistate',
+    'MPLView': 'deamat.mpl_view',
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        import importlib
+        module = importlib.import_module(_EXPORTS[name])
+        return getattr(module, name)
+    raise AttributeError(f"module 'deamat' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
@@ -3,13 +3,42 @@ from imgui_bundle.python_backends import pyglet_backend
 import pyglet
 from pyglet import gl
 
+import matplotlib
 from matplotlib import pyplot as plt
 
-from concurrent.futures import ProcessPoolExecutor
-from multiprocessing import Lock
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import asyncio
+import collections
+import inspect
+import multiprocessing as mp
+import sys
 import threading
+import time
+import traceback
+
+# Resolved once at import: each imgui enum attribute access crosses the
+# pybind11 boundary, so the OR chain is too expensive to redo per frame.
+_MAIN_WINDOW_FLAGS = imgui.WindowFlags_.menu_bar \
+    | imgui.WindowFlags_.no_decoration \
+    | imgui.WindowFlags_.no_resize \
+    | imgui.WindowFlags_.no_move \
+    | imgui.WindowFlags_.no_collapse \
+    | imgui.WindowFlags_.no_bring_to_front_on_focus
+
+_mpl_backend_configured = False
+
+
+def _configure_matplotlib(backend):
+    # Applied once per process: switching backends tears down and
+    # rebuilds matplotlib's canvas classes, so repeated GUI
+    # construction (tests, multi-window apps) must not redo it.
+    global _mpl_backend_configured
+    if _mpl_backend_configured:
+        return
+    matplotlib.use(backend)
+    _mpl_backend_configured = True
+
 
 class GUI():
     def __init__(self, state, width=1280, height=720):
@@ -23,10 +52,10 @@ class GUI():
         self.ctx = imgui.create_context()
         impl = pyglet_backend.create_renderer(window)
 
-        self.asyncio_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.asyncio_loop)
+        self.asyncio_loop = None
+        self._loop_ready = threading.Event()
         self.asyncio_thread = threading.Thread(
-            target=self.asyncio_loop.run_forever,
+            target=self._asyncio_main,
             daemon=True
         )
         self.update_async = None
@@ -35,83 +64,284 @@ class GUI():
         self.main_window_fullscreen = False
         self.main_window_name = "Main"
         self.impl = impl
+        self._executor = None
+        # Size of the job pool; None lets the executor use one worker
+        # per CPU. Only consulted when the pool is first created.
+        self.max_workers = None
+        # When True, figure make callbacks run on a worker thread so a
+        # slow rebuild does not stall the frame. Only applies to
+        # single-argument makes; in-place makes mutate the figure that
+        # is being displayed and therefore stay on the UI thread.
+        self.async_figures = False
+        self._figure_executor = None
+        self._built_figures = collections.deque()
         self.fps = 60.0
-        self.executor = ProcessPoolExecutor()
-        self.job_mutex = Lock()
+        # How long the loop may block waiting for events when nothing
+        # needs redrawing. Input or request_redraw() wakes it early.
+        self.idle_timeout = 1.0
+        # Animated apps (e.g. pyglet batch animations driven from the
+        # update callback) should set this to keep frames coming at
+        # fps even without input or dirty state.
+        self.continuous = False
+        self._dirty = True
         self.job_counter = 0
+        self._last_job_count = 0
+        self._last_mv_pos = None
+        self._last_mv_size = None
         self.update = None
         self.state = state
+        _configure_matplotlib(state.matplotlib_backend)
         state.window = {
             'width': self.window.get_size()[0],
             'height': self.window.get_size()[1]
         }
+        state._waker = self.request_redraw
+        # push_handlers keeps pyglet's default on_resize (which sets
+        # the GL viewport) in the dispatch chain.
+        window.push_handlers(on_resize=self._on_resize)
+
+    def _on_resize(self, width, height):
+        # Fired only when the size actually changes, so the cached
+        # size stays fresh without per-frame get_size() queries.
+        self.state.window['width'] = width
+        self.state.window['height'] = height
 
     def _create_main_window(self):
         mv = imgui.get_main_viewport()
-        imgui.set_next_window_pos((mv.pos.x, mv.pos.y))
-        imgui.set_next_window_size((mv.size.x, mv.size.y))
-        flags = imgui.WindowFlags_.menu_bar \
-            | imgui.WindowFlags_.no_decoration \
-            | imgui.WindowFlags_.no_resize \
-            | imgui.WindowFlags_.no_move \
-            | imgui.WindowFlags_.no_collapse \
-            | imgui.WindowFlags_.no_bring_to_front_on_focus
-        imgui.begin("Main", flags=flags)
+        pos = (mv.pos.x, mv.pos.y)
+        size = (mv.size.x, mv.size.y)
+        # imgui persists window placement between frames, so the
+        # set_next_window_* calls only need to go out on change.
+        if pos != self._last_mv_pos:
+            self._last_mv_pos = pos
+            imgui.set_next_window_pos(pos)
+        if size != self._last_mv_size:
+            self._last_mv_size = size
+            imgui.set_next_window_size(size)
+        imgui.begin("Main", flags=_MAIN_WINDOW_FLAGS)
 
     def _update_ui(self, dt):
-        self.impl.process_inputs()
+        # Completion callbacks only bump job_counter; the statusline
+        # string is built here, at frame rate, and only on change.
+        count = self.job_counter
+        if count != self._last_job_count:
+            self._last_job_count = count
+            if count == 0:
+                self.state.statusline = 'Ready'
+            else:
+                self.state.statusline = f'Executing {count} tasks...'
         imgui.new_frame()
-        self.state.update_window(self.window)
         if self.main_window_fullscreen:
             self._create_main_window()
         else:
             imgui.begin("Main")
-        self.job_mutex.acquire()
         self.update(self.state, self, dt)
-        self.job_mutex.release()
         imgui.end()
 
+    def _build_figure(self, f):
+        old = f.figure
+        if f.make_takes_figure:
+            # Retained mode: the make callback redraws into the
+            # existing figure instead of building a new one. The
+            # first build allocates the figure it will keep reusing.
+            if old is None:
+                old = plt.figure()
+                f.figure = old
+            else:
+                old.clear()
+            f.make(self.state, old)
+            fig = old
+        else:
+            fig = f.make(self.state)
+            if old is not None and old is not fig:
+                plt.close(old)
+                # Fresh figure: forget the size pushed into the old one.
+                f.applied_width = None
+                f.applied_height = None
+            f.figure = fig
+        w = f.width / 100
+        h = f.height / 100
+        if w != f.applied_width:
+            fig.set_figwidth(w)
+            f.applied_width = w
+        if h != f.applied_height:
+            fig.set_figheight(h)
+            f.applied_height = h
+        fig.tight_layout()
+        f.texture_dirty = True
+
+    def _build_figure_async(self, f):
+        # Worker-thread path: build a fresh figure and hand it over;
+        # Agg releases the GIL for the heavy rasterization work.
+        try:
+            fig = f.make(self.state)
+            fig.set_figwidth(f.width / 100)
+            fig.set_figheight(f.height / 100)
+            fig.tight_layout()
+            self._built_figures.append((f, fig))
+        except Exception:
+            # The submit() future is discarded, so re-raising would
+            # vanish into it unseen; report like _drain_sync_queue.
+            f.pending = False
+            traceback.print_exc()
+        finally:
+            self.request_redraw()
+
+    def _install_built_figures(self):
+        while self._built_figures:
+            f, fig = self._built_figures.popleft()
+            old = f.figure
+            if old is not None and old is not fig:
+                plt.close(old)
+            f.figure = fig
+            f.applied_width = fig.get_figwidth()
+            f.applied_height = fig.get_figheight()
+            f.texture_dirty = True
+            f.pending = False
+
+    def _drain_sync_queue(self):
+        q = self.state._sync_queue
+        # Drain only the batch present at frame start: a merge that
+        # posts follow-up work cannot stall this frame, and the
+        # leftover items keep _needs_frame true for the next one.
+        for _ in range(len(q)):
+            try:
+                fn = q.popleft()
+            except IndexError:
+                break
+            try:
+                fn()
+            except Exception:
+                traceback.print_exc()
+
     def _update_figures(self):
-        plt.style.use(self.state.plt_style)
-        plt.tight_layout()
-        for f in self.state.figures.values():
-            if 'dirty' not in f or f['dirty']:
-                f['dirty'] = False
-                f['figure'] = f['make'](self.state)
-                f['figure'].set_figwidth(f['width'] / 100)
-                f['figure'].set_figheight(f['height'] / 100)
+        self._install_built_figures()
+        if not self.state._dirty_figures:
+            return
+        # Snapshot and clear first so a make callback invalidating
+        # another figure is picked up next frame, not lost.
+        dirty = [self.state.figures[name]
+                 for name in self.state._dirty_figures]
+        self.state._dirty_figures.clear()
+        for f in dirty:
+            if f.make_takes_figure is None:
+                params = inspect.signature(f.make).parameters
+                f.make_takes_figure = len(params) > 1
+            if self.async_figures and not f.make_takes_figure:
+                if not f.pending:
+                    f.pending = True
+                    self.figure_executor.submit(self._build_figure_async, f)
+            else:
+                self._build_figure(f)
+
+    def request_redraw(self):
+        # Safe to call from worker threads: wakes the event loop if it
+        # is blocked waiting for input.
+        self._dirty = True
+        pyglet.app.platform_event_loop.notify()
+
+    def _needs_frame(self):
+        return self.continuous \
+            or self._dirty \
+            or bool(self.state._dirty_figures) \
+            or bool(self.state._sync_queue)
 
     def submit_job(self, job, *args, callback=None):
         future = self.executor.submit(job, *args)
+        self._dirty = True
+        # Plain int stores are atomic under the GIL; the statusline is
+        # derived from the counter once per frame in _update_ui.
         self.job_counter = self.job_counter + 1
-        self.state.statusline = f'Executing {self.job_counter} tasks...'
         if callback is not None:
             def callback_wrapper(future):
-                self.job_mutex.acquire()
                 try:
                     callback(future.result())
                 finally:
                     self.job_counter = self.job_counter - 1
-                    if self.job_counter == 0:
-                        status = 'Ready'
-                    else:
-                        status = f'Executing {self.job_counter} tasks...'
-                    self.state.statusline = status
-                    self.job_mutex.release()
+                    self.request_redraw()
             future.add_done_callback(callback_wrapper)
 
+    @property
+    def executor(self):
+        # Created on first use: spinning up worker processes is
+        # expensive and many apps never call submit_job.
+        if self._executor is None:
+            # forkserver forks workers from a minimal server process,
+            # so each worker skips re-importing the application the
+            # way spawn does, while staying safe to use alongside the
+            # asyncio helper thread (unlike plain fork).
+            if sys.platform == 'linux':
+                ctx = mp.get_context('forkserver')
+                # Import the heavy modules once in the server process;
+                # every forked worker then inherits them for free.
+                ctx.set_forkserver_preload(['matplotlib.pyplot'])
+            else:
+                ctx = mp.get_context('spawn')
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=ctx
+            )
+        return self._executor
+
+    @property
+    def figure_executor(self):
+        if self._figure_executor is None:
+            # Threads rather than processes: GUIState (pyglet batch,
+            # open figures) does not survive pickling.
+            self._figure_executor = ThreadPoolExecutor(
+                max_workers=2,
+                thread_name_prefix='deamat-figure'
+            )
+        return self._figure_executor
+
+    def _asyncio_main(self):
+        # The helper thread creates and owns the loop; the main thread
+        # only ever submits work via run_coroutine_threadsafe.
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.asyncio_loop = loop
+        self._loop_ready.set()
+        loop.run_forever()
+
     def exec_coroutine(self, co):
+        if self.asyncio_loop is None and not self.asyncio_thread.is_alive():
+            self.asyncio_thread.start()
+        self._loop_ready.wait()
         asyncio.run_coroutine_threadsafe(co, self.asyncio_loop)
 
     def run(self):
-        def draw(dt):
+        platform_loop = pyglet.app.platform_event_loop
+        platform_loop.start()
+        frame_dur = 1 / self.fps
+        last = time.monotonic()
+        next_frame = last + frame_dur
+        while not self.window.has_exit:
+            if self._needs_frame():
+                timeout = next_frame - time.monotonic()
+            else:
+                timeout = self.idle_timeout
+            platform_loop.step(max(0.0, timeout))
+            self.window.dispatch_events()
+            self.impl.process_inputs()
+            now = time.monotonic()
+            dt = now - last
+            last = now
+            next_frame += frame_dur
+            if next_frame < now:
+                # Fell badly behind; resync rather than trying to
+                # catch up with a burst of late frames.
+                next_frame = now + frame_dur
+            self._dirty = False
+            self._drain_sync_queue()
             self._update_figures()
             self._update_ui(dt)
             self.window.clear()
             imgui.render()
             self.state.batch.draw()
             self.impl.render(imgui.get_draw_data())
-        pyglet.clock.schedule_interval(draw, 1 / self.fps)
-        self.asyncio_thread.start()
-        pyglet.app.run()
+            self.window.flip()
+            # Block until the GPU has consumed this frame so the driver
+            # cannot queue several frames of stale input behind vsync.
+            gl.glFinish()
+        platform_loop.stop()
         self.impl.shutdown()
@@ -1,7 +1,41 @@
+import collections
+
 from matplotlib import pyplot as plt
 import pyglet
 
 
+class FigureRecord():
+    """Per-figure bookkeeping for GUIState.figures.
+
+    A __slots__ class rather than a dict: the render loop touches
+    these fields every frame, and slot loads are cheaper than hash
+    lookups.
+    """
+    __slots__ = ('figure', 'make', 'height', 'title', 'width',
+                 'make_takes_figure', 'pending',
+                 'applied_width', 'applied_height', 'texture_dirty')
+
+    def __init__(self, make, height, title, width):
+        # No placeholder figure: a Figure allocates its canvas buffer
+        # up front, and the first build replaces it anyway. Stays None
+        # until the first (possibly async) build completes.
+        self.figure = None
+        self.make = make
+        self.height = height
+        self.title = title
+        self.width = width
+        self.make_takes_figure = None
+        self.pending = False
+        # Size last pushed into the figure, in inches; lets the
+        # rebuild path skip matplotlib's layout invalidation when
+        # only the data changed.
+        self.applied_width = None
+        self.applied_height = None
+        # True when the figure's pixels changed since the widget last
+        # uploaded them; cleared by the widget after the upload.
+        self.texture_dirty = True
+
+
 class GUIState():
     def __init__(self):
         self.batch = None
@@ -13,6 +47,18 @@ class GUIState():
         self.config = None
         self.fig_width = 100
         self.figures = {}
+        # Names of figures awaiting a rebuild; lets the frame loop
+        # early-out in O(1) when nothing is dirty.
+        self._dirty_figures = set()
+        # Callables posted from coroutines / worker threads, applied
+        # on the UI thread each frame. A deque, not a queue.Queue:
+        # append/popleft are atomic under the GIL and an empty check
+        # is a plain bool() instead of a lock round-trip.
+        self._sync_queue = collections.deque()
+        # Set by GUI: called after posting sync work so a loop blocked
+        # waiting for input wakes up immediately.
+        self._waker = None
+        self._invalidator_cache = {}
         self.plt_style = 'dark_background'
         self.show_test_window = False
         self.show_demo_window = False
@@ -20,31 +66,52 @@ class GUIState():
         self.statusline = 'Ready'
         self.batch = pyglet.graphics.Batch()
 
+    # Applying a style is a merge over ~300 rcParams entries, so it
+    # happens reactively here instead of being polled by the frame loop.
+    @property
+    def plt_style(self):
+        return self._plt_style
+
+    @plt_style.setter
+    def plt_style(self, style):
+        if style == getattr(self, '_plt_style', None):
+            return
+        plt.style.use(style)
+        self._plt_style = style
+
     def set_plt_style(self, style):
         self.plt_style = style
-        plt.style.use(style)
         self.invalidate_all_figures()
 
     def add_figure(self, figname, figfunc, height=250, title="", width=0):
-        self.figures[figname] = {
-            'figure': plt.figure(),
-            'make': figfunc,
-            'height': height,
-            'title': title,
-            'width': width
-        }
+        """Register a figure built by figfunc.
+
+        figfunc may take either (state) and return a new Figure, or
+        (state, fig) and redraw into the cleared figure it is given.
+        Prefer the two-argument form: reusing the figure avoids
+        rebuilding axes, ticks and spines on every invalidation.
+        """
+        self.figures[figname] = FigureRecord(figfunc, height, title, width)
+        self._dirty_figures.add(figname)
 
     def invalidate_figure(self, figname, width=None, height=None):
         if figname in self.figures:
-            self.figures[figname]['dirty'] = True
+            f = self.figures[figname]
+            self._dirty_figures.add(figname)
             if width:
-                self.figures[figname]['width'] = width
+                f.width = width
             if height:
-                self.figures[figname]['height'] = height
+                f.height = height
 
     def invalidate_all_figures(self):
-        for f in self.figures.values():
-            f['dirty'] = True
+        self._dirty_figures.update(self.figures)
+
+    # Post a callable to be run on the UI thread before the next
+    # frame. Safe to call from coroutines and worker threads.
+    def sync(self, fn):
+        self._sync_queue.append(fn)
+        if self._waker is not None:
+            self._waker()
 
     def config_loaded(self):
         return self.config is not None
@@ -56,9 +123,13 @@ class GUIState():
         self.window['width'], self.window['height'] = window.get_size()
 
     # Produce a function that invalidates given
-    # figures when called
+    # figures when called. Memoized per name tuple so UI code that
+    # wires the same invalidator every frame reuses one closure.
     def invalidator(self, *args):
-        def inv():
-            for figname in args:
-                self.invalidate_figure(figname)
-        return inv
+        fn = self._invalidator_cache.get(args)
+        if fn is None:
+            def inv():
+                for figname in args:
+                    self.invalidate_figure(figname)
+            self._invalidator_cache[args] = fn = inv
+        return fn
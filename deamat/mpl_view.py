@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 
+import functools
 import pickle
-from matplotlib import font_manager
+import shutil
+import subprocess
+import threading
+import time
+import traceback
 import matplotlib.colors as mcolors
 
 from imgui_bundle import portable_file_dialogs as pfd
@@ -10,6 +15,91 @@ from imgui_bundle import imgui, imgui_fig
 from .guistate import GUIState
 from .gui import GUI
 
+# Fixed combo choices with value->index dicts alongside: .index() on
+# the lists is a linear scan repeated every popup frame.
+_FONT_WEIGHTS = ['ultralight', 'light', 'normal', 'regular', 'book', 'medium',
+                 'roman', 'semibold', 'demibold', 'demi', 'bold', 'heavy',
+                 'extra bold', 'black']
+_FONT_WEIGHT_INDEX = {w: i for i, w in enumerate(_FONT_WEIGHTS)}
+_VERTICAL_ALIGNMENTS = ['center', 'top', 'bottom', 'baseline']
+_VA_INDEX = {a: i for i, a in enumerate(_VERTICAL_ALIGNMENTS)}
+_HORIZONTAL_ALIGNMENTS = ['center', 'left', 'right']
+_HA_INDEX = {a: i for i, a in enumerate(_HORIZONTAL_ALIGNMENTS)}
+_LINETYPES = ['-', '--', '-.', ':']
+_LINETYPE_INDEX = {lt: i for i, lt in enumerate(_LINETYPES)}
+
+
+@functools.lru_cache(maxsize=256)
+def _to_rgba_cached(color):
+    return mcolors.to_rgba(color)
+
+
+def _to_rgba(color):
+    # to_rgba runs a regex + validation pass even for named colors;
+    # the settings widgets re-convert the same handful of values
+    # every frame, so memoize. matplotlib getters usually hand back
+    # strings or tuples, but list/array specs slip through on
+    # unpickled figures — coerce those before hitting the cache.
+    if not isinstance(color, (str, tuple)):
+        color = tuple(color)
+    return _to_rgba_cached(color)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_font_names():
+    # The installed-font list is immutable for the process lifetime;
+    # build the sorted list and the name->index dict exactly once
+    # instead of re-sorting hundreds of entries per popup frame.
+    # lru_cache also makes the warm-up race safe: a caller either
+    # gets the cached pair or computes an identical one.
+    #
+    # fontconfig enumerates family names in milliseconds; matplotlib's
+    # fontManager opens every TTF through FreeType and can take
+    # seconds on a cold cache, so it is the fallback, imported only
+    # when needed.
+    names = None
+    if shutil.which('fc-list'):
+        try:
+            out = subprocess.run(
+                ['fc-list', '--format=%{family[0]}\n'],
+                capture_output=True, text=True, check=True
+            ).stdout
+            names = sorted({line for line in out.splitlines() if line})
+        except (OSError, subprocess.SubprocessError):
+            names = None
+    if not names:
+        from matplotlib import font_manager
+        names = sorted({f.name for f in font_manager.fontManager.ttflist})
+    return names, {n: i for i, n in enumerate(names)}
+
+
+# Warm the cache off the UI thread at import: on a cold matplotlib
+# font cache, materializing ttflist rescans the system font dirs and
+# would otherwise stall the first click on a font popup. Benign race
+# with _get_font_names — both sides compute the same values and the
+# assignments are atomic.
+threading.Thread(target=_get_font_names, daemon=True).start()
+
+
+class _FontSnap:
+    """Snapshot of the text properties _font_ui edits.
+
+    Eight matplotlib getters per frame add up while a popup is open;
+    the snapshot is read once per text object and kept in sync by the
+    widgets themselves. Same __slots__ rationale as FigureRecord.
+    """
+    __slots__ = ('fontsize', 'fontweight', 'fontname', 'color',
+                 'va', 'ha', 'x', 'y')
+
+    def __init__(self, mpl_text):
+        self.fontsize = mpl_text.get_fontsize()
+        self.fontweight = mpl_text.get_fontweight()
+        self.fontname = mpl_text.get_fontname()
+        self.color = _to_rgba(mpl_text.get_color())
+        self.va = mpl_text.get_va()
+        self.ha = mpl_text.get_ha()
+        self.x, self.y = mpl_text.get_position()
+
 
 class MPLVState(GUIState):
     def __init__(self, fig):
@@ -18,52 +108,155 @@ class MPLVState(GUIState):
         self.fig_x = None
         self.fig_y = None
         self.sidebar_width = 450
+        # DPI used by Export as PNG; the displayed figure keeps its
+        # own DPI so on-screen rasterization cost stays flat.
+        self.export_dpi = fig.get_dpi()
+        self.refresh_required = True
+        self._last_draw_t = 0.0
+        # (label, Axes) pairs for the sidebar tabs; rebuilt only when
+        # the axes list changes so the per-frame loop skips the
+        # f-string formatting.
+        self._axes_cache = None
+        # Figure size in pixels; only changes on figsize/DPI edits,
+        # which all raise refresh_required.
+        self._fig_dims = None
+        # Tick-label lists keyed by (id(axes), axis name); matplotlib
+        # re-derives them on every get_ticklabels() call. Dropped on
+        # redraw, when tick counts may change.
+        self._ticklabel_cache = {}
+        # (axes, inverted transData) pair for click-to-data mapping;
+        # inverting is a matrix inversion, and the transform only
+        # changes on redraws.
+        self._inv_transform = None
+        # _FontSnap per text object, keyed by id(); dropped with the
+        # other artist-keyed caches on redraw, which also fences off
+        # id() reuse.
+        self._font_snapshots = {}
+        # RGB triples for the background color pickers, keyed by
+        # id(fig)/id(ax); spares a get_facecolor() + tuple slice per
+        # picker per frame.
+        self._facecolor_cache = {}
+
+    # Central entry point for "the figure's pixels changed": every
+    # settings handler funnels through here so one frame's worth of
+    # edits costs exactly one Agg re-render, however many widgets
+    # fired.
+    def request_refresh(self):
         self.refresh_required = True
+        # Wake the GUI loop: when the rate limiter defers a redraw the
+        # flag stays latched, and without this the trailing edit of a
+        # drag would wait for the next input event or idle timeout.
+        if self._waker is not None:
+            self._waker()
 
-    def load_figure(self, filename):
-        with open(filename, 'rb') as file:
-            fig = pickle.load(file)
+    def _install_figure(self, fig):
         self.fig = fig
+        self.export_dpi = fig.get_dpi()
+        self._axes_cache = None
+        self._fig_dims = None
+        self._ticklabel_cache.clear()
+        self._inv_transform = None
+        self._font_snapshots.clear()
+        self._facecolor_cache.clear()
+        self.refresh_required = True
+
+    def load_figure(self, filename):
+        """Load a pickled figure without blocking the UI.
+
+        The read and unpickle — hundreds of ms for a large figure —
+        run on a worker thread; the swap into self.fig is posted
+        through sync() so it happens on the UI thread between frames.
+        """
+        self.statusline = f'Loading {filename}...'
+
+        def work():
+            try:
+                # Slurp and pickle.loads: figure pickles run to
+                # megabytes, and feeding the unpickler a stream costs
+                # a syscall per small read.
+                with open(filename, 'rb') as file:
+                    fig = pickle.loads(file.read())
+            except Exception:
+                traceback.print_exc()
+                self.sync(lambda: setattr(
+                    self, 'statusline', f'Failed to load {filename}'
+                ))
+                return
+
+            def install():
+                self._install_figure(fig)
+                self.statusline = 'Ready'
+            self.sync(install)
+
+        threading.Thread(target=work, daemon=True).start()
 
 
 class MPLView():
     def __init__(self, fig):
         self.state = MPLVState(fig)
         self.gui = GUI(self.state)
-        self.gui.update = lambda state, gui, dt: self.update_ui(state, gui, dt)
+        self.gui.update = self.update_ui
         self.gui.main_window_fullscreen = True
 
         self.gui.state.add_figure(
             'Fig',
-            lambda state: self.state.fig,
+            self._make_fig,
             height=300,
             width=500,
             title='Figure 1'
         )
 
+    def _make_fig(self, state):
+        return self.state.fig
+
     def _figure_view_ui(self):
+        # Called right after imgui_fig.fig so the last item is the
+        # rendered figure; maps a click on it to data coordinates.
         state = self.state
-        figure = state.figure
 
-        if imgui.is_mouse_clicked(imgui.MOUSE_BUTTON_LEFT):
-            mouse_x, mouse_y = imgui.get_mouse_pos()
-            ax = figure.gca()
-            if ax.bbox.contains(mouse_x, mouse_y):
-                self.state.fig_x, self.state.fig_y = ax.transData.inverted().transform(
-                    (mouse_x, mouse_y)
-                )
+        if not (imgui.is_item_hovered()
+                and imgui.is_mouse_clicked(imgui.MouseButton_.left)):
+            return
+        axes = state.fig.axes
+        if not axes:
+            return
+        rect_min = imgui.get_item_rect_min()
+        rect_max = imgui.get_item_rect_max()
+        mouse = imgui.get_mouse_pos()
+        # The image is drawn 1:1 with the Agg canvas, so item-local
+        # coordinates are canvas pixels; imgui's y axis points down,
+        # matplotlib's up.
+        mouse_x = mouse.x - rect_min.x
+        mouse_y = rect_max.y - mouse.y
+        ax = axes[0]
+        # Four scalar compares instead of Bbox.contains, which
+        # builds intermediate arrays per call.
+        x0, y0, x1, y1 = ax.bbox.extents
+        if x0 <= mouse_x <= x1 and y0 <= mouse_y <= y1:
+            cached = state._inv_transform
+            if cached is None or cached[0] is not ax:
+                cached = (ax, ax.transData.inverted())
+                state._inv_transform = cached
+            state.fig_x, state.fig_y = cached[1].transform(
+                (mouse_x, mouse_y)
+            )
 
     def _sidebar_ui(self, state):
 
         if imgui.button("Apply Changes"):
-            state.refresh_required = True
+            state.request_refresh()
 
         if imgui.begin_tab_bar("SidebarTabs"):
             if imgui.begin_tab_item("Figure")[0]:
                 self._figure_settings_ui(state.fig)
                 imgui.end_tab_item()
-            for ax_n, ax in enumerate(state.fig.axes):
-                if imgui.begin_tab_item(f'Axes_{ax_n}')[0]:
+            axes = state.fig.axes
+            cache = state._axes_cache
+            if cache is None or len(cache) != len(axes):
+                cache = [(f'Axes_{i}', ax) for i, ax in enumerate(axes)]
+                state._axes_cache = cache
+            for label, ax in cache:
+                if imgui.begin_tab_item(label)[0]:
                     self._axes_settings_ui(ax)
                     imgui.end_tab_item()
 
@@ -72,132 +265,151 @@ class MPLView():
     def _font_ui(self, text_object):
         if isinstance(text_object, list):
             mpl_text = text_object[0]
+            targets = text_object
         else:
             mpl_text = text_object
-
-        mpltext_fontsize = mpl_text.get_fontsize()
-        mpltext_fontweight = mpl_text.get_fontweight()
-        mpltext_font = mpl_text.get_fontname()
-        mpltext_color = mcolors.to_rgba(mpl_text.get_color())
-        mpltext_va = mpl_text.get_va()
-        mpltext_ha = mpl_text.get_ha()
-        mpltext_x = mpl_text.get_position()[0]
-        mpltext_y = mpl_text.get_position()[1]
-
-        def update_mpltext():
-
-            def update(mtext):
-                mtext.set(
-                    fontsize=mpltext_fontsize, fontweight=mpltext_fontweight,
-                    fontname=mpltext_font,
-                    verticalalignment=mpltext_va, horizontalalignment=mpltext_ha,
-                    x=mpltext_x, y=mpltext_y,
-                    color=mpltext_color
-                )
-
-            if isinstance(text_object, list):
-                for element in text_object:
-                    update(element)
-            else:
-                update(mpl_text)
-
-        changed, mpltext_fontsize = imgui.input_int(
-            "Font Size", int(mpl_text.get_fontsize())
+            targets = (mpl_text,)
+
+        # Widgets read from the snapshot instead of round-tripping
+        # eight getters per frame, and write back what they change.
+        snaps = self.state._font_snapshots
+        snap = snaps.get(id(mpl_text))
+        if snap is None:
+            snap = _FontSnap(mpl_text)
+            snaps[id(mpl_text)] = snap
+
+        # Only the property whose widget fired gets written, via its
+        # direct setter: Artist.set() dispatches every kwarg through a
+        # generic setattr loop, which for 20+ tick labels meant ~160
+        # property writes per slider tick.
+        def update_mpltext(setter_name, value):
+            for mtext in targets:
+                getattr(mtext, setter_name)(value)
+            self.state.request_refresh()
+
+        changed, fontsize = imgui.input_int(
+            "Font Size", int(snap.fontsize)
         )
         if changed:
-            update_mpltext()
+            snap.fontsize = fontsize
+            update_mpltext('set_fontsize', fontsize)
 
-        available_fonts = sorted(set([f.name for f in font_manager.fontManager.ttflist]))
+        available_fonts, font_index = _get_font_names()
         changed, selected_font = imgui.combo(
-            "Font", available_fonts.index(mpltext_font), available_fonts
+            "Font", font_index.get(snap.fontname, 0), available_fonts
         )
         if changed:
-            mpltext_font = available_fonts[selected_font]
-            mpltext_fontweight = "normal"  # Reset font weight to default
-            update_mpltext()
-
-        font_weights = ['ultralight', 'light', 'normal', 'regular', 'book', 'medium',
-                        'roman', 'semibold', 'demibold', 'demi', 'bold', 'heavy',
-                        'extra bold', 'black'
-                        ]
+            snap.fontname = available_fonts[selected_font]
+            update_mpltext('set_fontname', snap.fontname)
+            # Reset font weight to default
+            snap.fontweight = 'normal'
+            update_mpltext('set_fontweight', 'normal')
+
         changed, fw_selection = imgui.combo(
-            "Font Weight", font_weights.index(mpltext_fontweight), font_weights
+            "Font Weight",
+            _FONT_WEIGHT_INDEX.get(snap.fontweight,
+                                   _FONT_WEIGHT_INDEX['normal']),
+            _FONT_WEIGHTS
         )
         if changed:
-            mpltext_fontweight = font_weights[fw_selection]
-            update_mpltext()
+            snap.fontweight = _FONT_WEIGHTS[fw_selection]
+            update_mpltext('set_fontweight', snap.fontweight)
 
-        vertical_alignments = ["center", "top", "bottom", "baseline"]
         changed, selected_va = imgui.combo(
-            "Vertical Alignment", vertical_alignments.index(mpltext_va), vertical_alignments
+            "Vertical Alignment", _VA_INDEX.get(snap.va, 0),
+            _VERTICAL_ALIGNMENTS
         )
         if changed:
-            mpltext_va = vertical_alignments[selected_va]
-            update_mpltext()
+            snap.va = _VERTICAL_ALIGNMENTS[selected_va]
+            update_mpltext('set_verticalalignment', snap.va)
 
-        horizontal_alignments = ["center", "left", "right"]
         changed, selected_ha = imgui.combo(
-            "Horizontal Alignment", horizontal_alignments.index(mpltext_ha), horizontal_alignments
+            "Horizontal Alignment", _HA_INDEX.get(snap.ha, 0),
+            _HORIZONTAL_ALIGNMENTS
         )
         if changed:
-            mpltext_ha = horizontal_alignments[selected_ha]
-            update_mpltext()
+            snap.ha = _HORIZONTAL_ALIGNMENTS[selected_ha]
+            update_mpltext('set_horizontalalignment', snap.ha)
 
-        changed, mpltext_color = imgui.color_edit3("Font Color", mpltext_color[:3])
+        changed, color = imgui.color_edit3("Font Color", snap.color[:3])
         if changed:
-            update_mpltext()
+            snap.color = color
+            update_mpltext('set_color', color)
 
-        changed, (mpltext_x, mpltext_y) = imgui.input_float2(
-            "Position", (mpltext_x, mpltext_y)
+        changed, (x, y) = imgui.input_float2(
+            "Position", (snap.x, snap.y)
         )
         if changed:
-            update_mpltext()
+            snap.x, snap.y = x, y
+            update_mpltext('set_x', x)
+            update_mpltext('set_y', y)
 
     def _figure_settings_ui(self, fig):
         imgui.text('Figure settings')
 
+        # Size/DPI edits apply eagerly (the setters are cheap) but
+        # only trigger rasterization when the field is committed —
+        # Enter, tab-away or click elsewhere — so typing a number is
+        # one redraw, not one per keystroke.
         changed, fig_width = imgui.input_float(
-            "Width, in", fig.get_figwidth(), 0.1, 1.0,
-            flags=imgui.InputTextFlags_.enter_returns_true
+            "Width, in", fig.get_figwidth(), 0.1, 1.0
         )
         if changed and fig_width > 0.5:
             fig.set_figwidth(fig_width)
-            self.state.refresh_required = True
+        if imgui.is_item_deactivated_after_edit():
+            self.state.request_refresh()
 
         changed, fig_height = imgui.input_float(
-            "Height, in", fig.get_figheight(), 0.1, 1.0,
-            flags=imgui.InputTextFlags_.enter_returns_true
+            "Height, in", fig.get_figheight(), 0.1, 1.0
         )
         if changed and fig_height > 0.5:
             fig.set_figheight(fig_height)
-            self.state.refresh_required = True
-
-        changed, fig_dpi = imgui.input_float(
-            "DPI", fig.get_dpi(), 1.0, 10.0,
-            flags=imgui.InputTextFlags_.enter_returns_true
-
+        if imgui.is_item_deactivated_after_edit():
+            self.state.request_refresh()
+
+        # Export resolution only: raising the on-screen DPI would
+        # scale Agg's rasterization cost with the square of the
+        # factor, so the display keeps the figure's own DPI and the
+        # requested value is applied by Export as PNG.
+        changed, export_dpi = imgui.input_float(
+            "Export DPI", self.state.export_dpi, 1.0, 10.0
         )
-        if changed and fig_dpi > 10:
-            fig.set_dpi(fig_dpi)
-            self.state.refresh_required = True
-
-        changed, bg_color = imgui.color_edit3("Background Color", fig.get_facecolor()[:3])
+        if changed and export_dpi > 10:
+            self.state.export_dpi = export_dpi
+
+        colors = self.state._facecolor_cache
+        bg = colors.get(id(fig))
+        if bg is None:
+            bg = tuple(fig.get_facecolor()[:3])
+            colors[id(fig)] = bg
+        changed, bg_color = imgui.color_edit3("Background Color", bg)
         if changed:
+            colors[id(fig)] = tuple(bg_color)
             fig.patch.set_facecolor(bg_color)
+            self.state.request_refresh()
 
-        _, has_suptitle = imgui.checkbox("Figure title", fig._suptitle is not None)
-        if not has_suptitle:
-            fig.suptitle('')
-            fig._suptitle = None
+        # Act only on checkbox transitions: fig.suptitle() runs the
+        # full suptitle layout pass, and the old code invoked it every
+        # frame the box was unchecked.
+        changed, has_suptitle = imgui.checkbox(
+            "Figure title", fig._suptitle is not None
+        )
+        if changed:
+            if has_suptitle:
+                fig.suptitle("")
+            else:
+                fig._suptitle.remove()
+                fig._suptitle = None
+            self.state.request_refresh()
+        if fig._suptitle is None:
             return
-        if has_suptitle and fig._suptitle is None:
-            fig.suptitle("")
 
         self._font_button_ui(fig._suptitle, id="suptitle")
         imgui.same_line()
         changed, sptext = imgui.input_text("Suptitle text", fig._suptitle.get_text(), 256)
         if changed:
             fig.suptitle(sptext)
+            self.state.request_refresh()
 
     def _axis_gridline_settings(self, ax, gridlines, which, axis):
         id = f'ax_grid_{which}_{axis}'
@@ -209,14 +421,13 @@ class MPLView():
             )
             if changed:
                 ax.grid(visible, which=which, axis=axis)
+                self.state.request_refresh()
 
             if not visible:
                 return
 
         else:
-            linetype_list = ['-', '--', '-.', ':']
-
-            color = mcolors.to_rgba(gridlines[0].get_color())
+            color = _to_rgba(gridlines[0].get_color())
             alpha = gridlines[0].get_alpha() or 1
             linetype = gridlines[0].get_linestyle()
             width = gridlines[0].get_linewidth()
@@ -229,41 +440,53 @@ class MPLView():
             if width is None:
                 width = 0.1
 
-            try:
-                lt_id = linetype_list.index(linetype)
-            except:
-                lt_id = 0
+            lt_id = _LINETYPE_INDEX.get(linetype, 0)
 
             changed, visible = imgui.checkbox(
                 f'Visible##{id}', visible
             )
             if changed:
+                # Visibility is the one property that changes which
+                # artists exist, so it still goes through ax.grid.
                 ax.grid(visible, which=which, axis=axis)
+                self.state.request_refresh()
 
             if not visible:
                 return
 
+            # Property edits mutate the existing Line2D artists
+            # directly: ax.grid(True, ...) re-derives the whole grid
+            # from rcParams on every call, which at slider rates means
+            # a full tick-artist rebuild per frame.
             changed, alpha = imgui.slider_float(
                 f'Alpha##{id}', alpha, 0.0, 1.0
             )
             if changed:
-                ax.grid(True, which=which, axis=axis, alpha=alpha)
+                for ln in gridlines:
+                    ln.set_alpha(alpha)
+                self.state.request_refresh()
 
             changed, lt_id = imgui.combo(
-                f'Linetype##{id}', lt_id, linetype_list
+                f'Linetype##{id}', lt_id, _LINETYPES
             )
             if changed:
-                ax.grid(True, which=which, axis=axis, linestyle=linetype_list[lt_id])
+                for ln in gridlines:
+                    ln.set_linestyle(_LINETYPES[lt_id])
+                self.state.request_refresh()
 
             changed, color = imgui.color_edit3(f'Color##{id}', color[:3])
             if changed:
-                ax.grid(True, which=which, axis=axis, color=color)
+                for ln in gridlines:
+                    ln.set_color(color)
+                self.state.request_refresh()
 
             changed, width = imgui.input_float(
                 f'Linewidth##{id}', width
             )
             if changed:
-                ax.grid(True, which=which, axis=axis, linewidth=width)
+                for ln in gridlines:
+                    ln.set_linewidth(width)
+                self.state.request_refresh()
 
     def _axis_grid_settings(self, ax):
         if imgui.begin_tab_bar("GridlineTabs"):
@@ -300,102 +523,133 @@ class MPLView():
         imgui.pop_id()
 
     def _axis_settings(self, ax):
+        # One dict lookup per spine per frame instead of ~10: every
+        # widget below reads from these locals.
+        spines = ax.spines
+        top = spines['top']
+        bottom = spines['bottom']
+        left = spines['left']
+        right = spines['right']
+
         self._font_button_ui(ax.yaxis.get_label(), id="xaxis_font")
         imgui.same_line()
         changed, xlabel = imgui.input_text("X Label", ax.get_xlabel(), 256)
         if changed:
             ax.set_xlabel(xlabel)
+            self.state.request_refresh()
 
         self._font_button_ui(ax.yaxis.get_label(), id="yaxis_font")
         imgui.same_line()
         changed, ylabel = imgui.input_text("Y Label", ax.get_ylabel(), 256)
         if changed:
             ax.set_ylabel(ylabel)
+            self.state.request_refresh()
 
         changed, axis_on = imgui.checkbox("Axis On", ax.axison)
         if changed:
             ax.set_axis_on() if axis_on else ax.set_axis_off()
+            self.state.request_refresh()
 
         imgui.same_line()
         changed, frame_on = imgui.checkbox("Frame On", ax.get_frame_on())
         if changed:
             ax.set_frame_on(frame_on)
+            self.state.request_refresh()
 
-        changed, top_spine_on = imgui.checkbox("Top Spine", ax.spines['top'].get_visible())
-        if changed:
-            ax.spines['top'].set_visible(top_spine_on)
-
-        imgui.same_line()
-        changed, bottom_spine_on = imgui.checkbox("Bottom Spine", ax.spines['bottom'].get_visible())
-        if changed:
-            ax.spines['top'].set_visible(bottom_spine_on)
-
-        imgui.same_line()
-        changed, right_spine_on = imgui.checkbox("Right Spine", ax.spines['right'].get_visible())
-        if changed:
-            ax.spines['right'].set_visible(right_spine_on)
-
-        imgui.same_line()
-        changed, left_spine_on = imgui.checkbox("Left Spine", ax.spines['left'].get_visible())
-        if changed:
-            ax.spines['left'].set_visible(left_spine_on)
+        for spine, label in ((top, 'Top Spine'), (bottom, 'Bottom Spine'),
+                             (right, 'Right Spine'), (left, 'Left Spine')):
+            if spine is not top:
+                imgui.same_line()
+            changed, visible = imgui.checkbox(label, spine.get_visible())
+            if changed:
+                spine.set_visible(visible)
+                self.state.request_refresh()
 
-        axis_color_x = ax.spines['bottom'].get_edgecolor()
-        axis_color_y = ax.spines['left'].get_edgecolor()
+        axis_color_x = bottom.get_edgecolor()
+        axis_color_y = left.get_edgecolor()
 
+        old_lw = (
+            top.get_linewidth(),
+            bottom.get_linewidth(),
+            right.get_linewidth(),
+            left.get_linewidth()
+        )
         changed, (lw_t, lw_b, lw_r, lw_l) = imgui.input_float4(
-            "Linewidth",
-            (
-                ax.spines['top'].get_linewidth(),
-                ax.spines['bottom'].get_linewidth(),
-                ax.spines['right'].get_linewidth(),
-                ax.spines['left'].get_linewidth()
-            )
+            "Linewidth", old_lw
         )
         if changed:
-            ax.spines['bottom'].set_linewidth(lw_b)
-            ax.spines['top'].set_linewidth(lw_t)
-            ax.spines['left'].set_linewidth(lw_l)
-            ax.spines['right'].set_linewidth(lw_r)
+            # Push only the component that moved: each set_linewidth
+            # invalidates that spine's path cache even when the value
+            # is unchanged.
+            if lw_t != old_lw[0]:
+                top.set_linewidth(lw_t)
+            if lw_b != old_lw[1]:
+                bottom.set_linewidth(lw_b)
+            if lw_r != old_lw[2]:
+                right.set_linewidth(lw_r)
+            if lw_l != old_lw[3]:
+                left.set_linewidth(lw_l)
+            self.state.request_refresh()
 
         changed, axis_color_x = imgui.color_edit3("X Axis Color", axis_color_x[:3])
         if changed:
-            ax.spines['bottom'].set_edgecolor(axis_color_x)
-            ax.spines['top'].set_edgecolor(axis_color_x)
+            bottom.set_edgecolor(axis_color_x)
+            top.set_edgecolor(axis_color_x)
+            self.state.request_refresh()
 
         changed, axis_color_y = imgui.color_edit3("Y Axis Color", axis_color_y[:3])
         if changed:
-            ax.spines['left'].set_edgecolor(axis_color_y)
-            ax.spines['right'].set_edgecolor(axis_color_y)
+            left.set_edgecolor(axis_color_y)
+            right.set_edgecolor(axis_color_y)
+            self.state.request_refresh()
 
+        cache = self.state._ticklabel_cache
         if imgui.collapsing_header('X Tick properties'):
+            labels = cache.get((id(ax), 'x'))
+            if labels is None:
+                labels = ax.xaxis.get_ticklabels()
+                cache[(id(ax), 'x')] = labels
             imgui.begin_child('xtickprops')
-            self._font_ui(ax.xaxis.get_ticklabels())
+            self._font_ui(labels)
             imgui.end_child()
 
         if imgui.collapsing_header('Y Tick properties'):
+            labels = cache.get((id(ax), 'y'))
+            if labels is None:
+                labels = ax.yaxis.get_ticklabels()
+                cache[(id(ax), 'y')] = labels
             imgui.begin_child('ytickprops')
-            self._font_ui(ax.xaxis.get_ticklabels())
+            self._font_ui(labels)
             imgui.end_child()
 
     def _axes_settings_ui(self, ax):
         changed, title = imgui.input_text("Title", ax.get_title(), 256)
         if changed:
             ax.set_title(title)
-
-        changed, bg_color = imgui.color_edit3("Axes Background Color", ax.get_facecolor()[:3])
+            self.state.request_refresh()
+
+        colors = self.state._facecolor_cache
+        bg = colors.get(id(ax))
+        if bg is None:
+            bg = tuple(ax.get_facecolor()[:3])
+            colors[id(ax)] = bg
+        changed, bg_color = imgui.color_edit3("Axes Background Color", bg)
         if changed:
+            colors[id(ax)] = tuple(bg_color)
             ax.set_facecolor(bg_color)
+            self.state.request_refresh()
 
         imgui.separator_text('Scale')
 
         changed, x_log_scale = imgui.checkbox("Logarithmic X Scale", ax.get_xscale() == 'log')
         if changed:
             ax.set_xscale('log' if x_log_scale else 'linear')
+            self.state.request_refresh()
 
         changed, y_log_scale = imgui.checkbox("Logarithmic Y Scale", ax.get_yscale() == 'log')
         if changed:
             ax.set_yscale('log' if y_log_scale else 'linear')
+            self.state.request_refresh()
 
         imgui.separator_text('Axis')
         self._axis_settings(ax)
@@ -413,10 +667,23 @@ class MPLView():
                     file_path = pfd.save_file(
                         "Save Figure as Pickle", "", "",
                         ["Pickle files (*.pkl)", "All files (*.*)"]
-                    )
+                    ).result()
                     if file_path:
                         with open(file_path, 'wb') as file:
-                            pickle.dump(self.state.fig, file)
+                            # Protocol 5 serializes the numpy arrays
+                            # inside the figure as contiguous buffers
+                            # instead of copied bytestrings.
+                            pickle.dump(self.state.fig, file,
+                                        protocol=pickle.HIGHEST_PROTOCOL)
+                elif clicked_save:
+                    file_path = pfd.save_file(
+                        "Export as PNG", "", "",
+                        ["PNG files (*.png)", "All files (*.*)"]
+                    ).result()
+                    if file_path:
+                        # Export rasterizes at export_dpi; the
+                        # on-screen figure keeps its display DPI.
+                        state.fig.savefig(file_path, dpi=state.export_dpi)
                 elif clicked_exit:
                     exit(0)
                 imgui.end_menu()
@@ -429,20 +696,47 @@ class MPLView():
 
         # Center the figure horizontally and vertically
         column_width = imgui.get_column_width()
-        figure_width = state.fig.get_figwidth() * state.fig.get_dpi()
-        figure_height = state.fig.get_figheight() * state.fig.get_dpi()
+        # Pixel dims change only on figsize/DPI edits, and those all
+        # raise refresh_required; recompute just on those frames.
+        if state._fig_dims is None or state.refresh_required:
+            state._fig_dims = (
+                state.fig.get_figwidth() * state.fig.get_dpi(),
+                state.fig.get_figheight() * state.fig.get_dpi()
+            )
+        figure_width, figure_height = state._fig_dims
 
         imgui.set_cursor_pos_x((column_width - figure_width) / 2)
         imgui.set_cursor_pos_y((available_height - figure_height) / 2)
 
+        # The refresh decision is made once per frame, here. imgui_fig
+        # re-rasterizes the whole figure on refresh_image=True and
+        # serves its cached texture otherwise, so keeping this flag
+        # honest is what keeps Agg work off idle frames.
+        refresh = state.refresh_required
+        if refresh:
+            now = time.monotonic()
+            if now - state._last_draw_t < 1 / 60:
+                # Mid-drag: keep the flag set and redraw next frame,
+                # so a held slider rasterizes at most once per ~16 ms.
+                refresh = False
+            else:
+                state._last_draw_t = now
+                state.refresh_required = False
+                # Redraws can re-derive ticks (autoscale, new locator
+                # results) and move transforms, so the caches keyed on
+                # the pre-draw state go stale here.
+                state._ticklabel_cache.clear()
+                state._inv_transform = None
+                state._font_snapshots.clear()
+                state._facecolor_cache.clear()
         imgui_fig.fig(
             '',
             state.fig,
             size=(figure_width, figure_height),
-            refresh_image=state.refresh_required,
+            refresh_image=refresh,
             resizable=False
         )
-        state.refresh_required = False
+        self._figure_view_ui()
 
         imgui.next_column()
         self._sidebar_ui(state)
@@ -1,3 +1,4 @@
+import contextlib
 import multiprocessing
 # import imgui
 from imgui_bundle import portable_file_dialogs as pfd
@@ -7,6 +8,25 @@ import pickle
 from .mpl_view import MPLView
 
 
+@contextlib.contextmanager
+def style_vars(*pairs):
+    """Push several (StyleVar, value) pairs and pop them all at once.
+
+    with style_vars((imgui.StyleVar_.window_rounding, 0.0),
+                    (imgui.StyleVar_.window_padding, (0.0, 0.0))):
+        ...
+
+    Saves user code from matching individual push/pop calls and pops
+    the whole batch with a single pop_style_var(n).
+    """
+    for var, value in pairs:
+        imgui.push_style_var(var, value)
+    try:
+        yield
+    finally:
+        imgui.pop_style_var(len(pairs))
+
+
 def open_figure_in_pyplot(pickled_figure):
     fig = pickle.loads(pickled_figure)
     view = MPLView(fig)
@@ -15,16 +35,21 @@ def open_figure_in_pyplot(pickled_figure):
 
 def im_plot_figure(state, figname, width=None, height=None, autosize=False):
     fig_obj = state.figures[figname]
-    figure = fig_obj['figure']
-    title = fig_obj['title']
+    figure = fig_obj.figure
+    title = fig_obj.title
+
+    if figure is None:
+        # First build (possibly on a worker thread) has not finished.
+        imgui.text(f'Building {title}...')
+        return
 
     if autosize:
-        fig_obj['width'], fig_obj['height'] = imgui.get_content_region_available()
+        fig_obj.width, fig_obj.height = imgui.get_content_region_available()
     else:
         if width:
-            fig_obj['width'] = width
+            fig_obj.width = width
         if height:
-            fig_obj['height'] = height
+            fig_obj.height = height
     if imgui.button('Redraw ' + title):
         state.invalidate_figure(figname)
     imgui.same_line()
@@ -39,4 +64,8 @@ def im_plot_figure(state, figname, width=None, height=None, autosize=False):
         if len(fpath) > 0:
             state.figure_path = fpath
             figure.savefig(fpath)
-    imgui_fig.fig('', figure)
+    # Re-upload the texture only on frames where the figure was
+    # actually rebuilt; otherwise imgui_fig reuses the cached one.
+    refresh = fig_obj.texture_dirty
+    fig_obj.texture_dirty = False
+    imgui_fig.fig('', figure, refresh_image=refresh)
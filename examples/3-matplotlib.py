@@ -30,13 +30,14 @@ def update_ui(state, gui, dt):
     imgui.end()
 
 
-def imfig_hist(state: State) -> plt.Figure:
-    fig, ax = plt.subplots()
+def imfig_hist(state: State, fig: plt.Figure) -> None:
+    # Two-argument form: draw into the cleared figure we are given
+    # instead of constructing a new one on every invalidation.
+    ax = fig.add_subplot()
     ax.hist(state.series, bins=20, alpha=0.75)
     ax.set_title('Histogram of Series')
     ax.set_xlabel('Value')
     ax.set_ylabel('Frequency')
-    return fig
 
 
 def main():
@@ -42,6 +42,8 @@ def update_gui(state, gui, dt):
 def main():
     gui = dGUI(State())
     gui.update = update_gui
+    # The circle animates every frame, so opt out of idle waiting.
+    gui.continuous = True
     gui.run()
 
 
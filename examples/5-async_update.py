@@ -13,10 +13,17 @@ class State(GUIState):
         self.value = 0
 
 async def delayed_exec(state):
-    state.status = 'sleeping'
+    # Post mutations through sync() so they run on the UI thread and
+    # wake the event loop; assigning directly from the asyncio thread
+    # would leave the result invisible until the next input event or
+    # idle tick.
+    state.sync(lambda: setattr(state, 'status', 'sleeping'))
     await asyncio.sleep(2)
-    state.value += 1
-    state.status = ''
+
+    def apply():
+        state.value += 1
+        state.status = ''
+    state.sync(apply)
 
 
 def update_ui(state, gui, dt):